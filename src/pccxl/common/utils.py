@@ -1,4 +1,4 @@
-import uuid
+import os
 
 SIDE_MAPPING = {
     "buy": "sell",
@@ -7,4 +7,6 @@ SIDE_MAPPING = {
 
 
 def flat_uuid() -> str:
-    return str(uuid.uuid4()).replace('-', '')
+    # same 32-char hex string as uuid4 without dashes, minus the UUID
+    # object, canonical formatting and replace() pass
+    return os.urandom(16).hex()
@@ -1,17 +1,26 @@
 import base64
-import hashlib
 import hmac
 import json
 import time
-from typing import Optional
+from decimal import ROUND_FLOOR, Decimal
+from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from ....common.utils import SIDE_MAPPING, flat_uuid
+try:
+    # orjson serializes straight to bytes and parses bytes directly
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
+from ....common.utils import flat_uuid
 from ..exceptions import KucoinAPIException, KucoinRequestException
-from ..validations import (validate_amount_size, validate_hidden_and_iceberg,
-                           validate_iceberg, validate_post_only, validate_side,
-                           validate_stop, validate_stop_loss_take_profit,
+from ..validations import (validate_order, validate_post_only,
                            validate_time_in_force)
 
 
@@ -24,6 +33,11 @@ class Client:
         "content-type": "application/json"
     }
 
+    REQUEST_TIMEOUT = 30
+
+    # contract metadata changes very rarely; cache it for an hour
+    CONTRACT_CACHE_TTL = 3600
+
     def __init__(self, api_key, api_secret, passphrase):
         """Kucoin API Client constructor
 
@@ -40,6 +54,45 @@ class Client:
         self.API_SECRET = api_secret
         self.API_PASSPHRASE = passphrase
 
+        # precompute the constant parts of request signing: the encoded
+        # secret is reused for every signature and the passphrase
+        # signature never changes for the lifetime of the client
+        self._secret_bytes = api_secret.encode('utf-8')
+        self._passphrase_header = base64.b64encode(
+            hmac.digest(
+                self._secret_bytes,
+                passphrase.encode('utf-8'),
+                'sha256'
+            )
+        )
+
+        # per-instance header template carrying every constant header;
+        # _signed_headers copies it and fills in only timestamp + signature
+        self._base_headers = dict(self.DEFAULT_HEADERS)
+        self._base_headers.update({
+            'KC-API-KEY': api_key,
+            'KC-API-PASSPHRASE': self._passphrase_header,
+            'KC-API-KEY-VERSION': "2",
+        })
+
+        self._timeout = self.REQUEST_TIMEOUT
+        self._contract_cache: Dict[str, Tuple[float, dict]] = {}
+        self._inv_multipliers: Dict[str, Decimal] = {}
+        self._session = requests.Session()
+        self._session.headers.update(self.DEFAULT_HEADERS)
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        )
+        # bound method references skip the generic verb dispatch inside
+        # Session.request on every call
+        self._post = self._session.post
+        self._get = self._session.get
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
     @staticmethod
     def _handle_response(response):
         """Internal helper for handling API responses from the Kucoin server.
@@ -47,25 +100,33 @@ class Client:
         the response.
         """
 
-        if not str(response.status_code).startswith('2'):
+        status_code = response.status_code
+        if status_code < 200 or status_code >= 300:
             raise KucoinAPIException(response)
-        try:
-            res = response.json()
 
-            if 'code' in res and res['code'] != "200000":
-                raise KucoinAPIException(response)
+        # decode the raw bytes directly, skipping the charset-detection
+        # path inside response.json()
+        content = response.content
+        if not content:
+            return {}
 
-            if 'success' in res and not res['success']:
-                raise KucoinAPIException(response)
-
-            # by default return full response
-            # if it's a normal response we have a data attribute, return that
-            if 'data' in res:
-                res = res['data']
-            return res
+        try:
+            res = _json_loads(content)
         except ValueError:
             raise KucoinRequestException(f'Invalid Response: {response.text}')
 
+        if 'code' in res and res['code'] != "200000":
+            raise KucoinAPIException(response)
+
+        if 'success' in res and not res['success']:
+            raise KucoinAPIException(response)
+
+        # by default return full response
+        # if it's a normal response we have a data attribute, return that
+        if 'data' in res:
+            res = res['data']
+        return res
+
     def _create_path(self, path, api_version=None):
         api_version = api_version or self.API_V1
         return f'/api/{api_version}/{path}'
@@ -75,29 +136,34 @@ class Client:
 
     def _generate_signature(
         self,
-        nonce: str,
-        method: str,
-        api_path: str,
-        data: str
+        nonce: bytes,
+        method: bytes,
+        api_path: bytes,
+        data: bytes
     ) -> bytes:
-        str_to_sign = f"{nonce}{method}{api_path}{data}"
-        signature = base64.b64encode(
-            hmac.new(
-                self.API_SECRET.encode('utf-8'),
-                str_to_sign.encode('utf-8'),
-                hashlib.sha256
-            ).digest()
+        # hmac.digest is a one-shot that skips the Python-level HMAC
+        # wrapper and runs entirely inside OpenSSL; concatenating bytes
+        # directly avoids an intermediate str and its UTF-8 re-encode
+        return base64.b64encode(
+            hmac.digest(
+                self._secret_bytes,
+                nonce + method + api_path + data,
+                'sha256'
+            )
         )
-        return signature
 
-    def _generate_passphrase(self) -> bytes:
-        return base64.b64encode(
-            hmac.new(
-                self.API_SECRET.encode('utf-8'),
-                self.API_PASSPHRASE.encode('utf-8'),
-                hashlib.sha256
-            ).digest()
+    def _signed_headers(self, method: str, full_path: str, data: bytes) -> dict:
+        headers = self._base_headers.copy()
+
+        timestamp = str(time.time_ns() // 1_000_000)
+        headers['KC-API-TIMESTAMP'] = timestamp
+        headers['KC-API-SIGN'] = self._generate_signature(
+            timestamp.encode('ascii'),
+            method.encode('ascii'),
+            full_path.encode('ascii'),
+            data
         )
+        return headers
 
     def _request(
             self,
@@ -106,29 +172,20 @@ class Client:
             api_version: Optional[str] = None,
             **kwargs
     ) -> dict:
-        # set default requests timeout
-        data = kwargs.get('data', {})
-        headers = kwargs.get('headers', self.DEFAULT_HEADERS)
-
-        data = json.dumps(data)
+        # serialize once; the same bytes are signed and sent as the body
+        data = _json_dumps(kwargs.get('data', {}))
 
         full_path = self._create_path(path, api_version)
         url = self._create_url(full_path)
 
-        # generate signature
-        nonce = int(time.time() * 1000)
-        headers['KC-API-TIMESTAMP'] = str(nonce)
-        headers['KC-API-SIGN'] = self._generate_signature(
-            nonce, method, full_path, data)
-        headers['KC-API-KEY'] = self.API_KEY
-        headers['KC-API-PASSPHRASE'] = self._generate_passphrase()
-        headers['KC-API-KEY-VERSION'] = "2"
-
-        response = requests.request(
-            method=method,
-            url=url,
+        headers = self._signed_headers(method, full_path, data)
+
+        request_fn = self._post if method == "POST" else self._get
+        response = request_fn(
+            url,
             data=data,
-            headers=headers
+            headers=headers,
+            timeout=self._timeout
         )
         return self._handle_response(response)
 
@@ -139,68 +196,136 @@ class Client:
         stop_loss_price: float,
         take_profit_price: float
     ) -> dict:
-        validate_side(order["side"])
-        validate_stop(
-            order.get("stop"),
-            order.get("stopPrice"),
-            order.get("stopPriceType")
-        )
-        validate_stop_loss_take_profit(
-            order.get("stop"),
-            stop_loss_price,
-            take_profit_price)
-        validate_amount_size(amount, order.get("size"))
+        validate_order(order, amount, stop_loss_price, take_profit_price)
 
         if order.get("clientOid") is None:
             order["clientOid"] = flat_uuid()
 
         if amount:
-            symbol_info = self.contract_info(order['symbol'])
-            multiplier = symbol_info.get("multiplier")
-            size = None
-            if amount >= 1 and multiplier < 1:
-                size = int(amount * (1 / multiplier))
-            else:
-                size = amount // multiplier
-
-            if size is None:
-                raise
-            order["size"] = size
+            symbol = order['symbol']
+            # populates the per-symbol inverse multiplier as a side effect
+            self.contract_info(symbol)
+            order["size"] = self._amount_to_size(
+                amount, self._inv_multipliers[symbol])
 
         new_order_response = self._request("POST", "orders", data=order)
 
+        side = order['side']
+        opposite = "sell" if side == "buy" else "buy"
+        direction_down = "down" if side == "buy" else "up"
+        direction_up = "up" if side == "buy" else "down"
+
         if stop_loss_price:
-            stop_loss_order = order.copy()
-            stop_loss_order["clientOid"] = flat_uuid()
-            stop_loss_order["side"] = SIDE_MAPPING.get(order['side'])
-            stop_loss_order["stop"] = "down" if order['side'] == "buy" else "up"
-            stop_loss_order["stopPrice"] = stop_loss_price
-            stop_loss_order["stopPriceType"] = "TP"
-            stop_loss_order["reduceOnly"] = True
+            stop_loss_order = self._build_reduce_only(
+                order, opposite, stop_loss_price, direction_down)
             self._request("POST", "orders", data=stop_loss_order)
 
         if take_profit_price:
-            take_profit_order = order.copy()
-            take_profit_order["clientOid"] = flat_uuid()
-            take_profit_order["side"] = SIDE_MAPPING[order['side']]
-            take_profit_order["stop"] = "up" if order['side'] == "buy" else "down"
-            take_profit_order["stopPrice"] = take_profit_price
-            take_profit_order["stopPriceType"] = "TP"
-            take_profit_order["reduceOnly"] = True
+            take_profit_order = self._build_reduce_only(
+                order, opposite, take_profit_price, direction_up)
             self._request("POST", "orders", data=take_profit_order)
 
         return new_order_response
 
+    @staticmethod
+    def _amount_to_size(amount: float, inv_multiplier: Decimal) -> int:
+        """Convert a quote ``amount`` into a contract size.
+
+        Decimal math avoids the float-reciprocal rounding that could
+        under-size by one lot (e.g. ``0.1 / 0.001`` giving 99 not 100).
+        """
+        return int(
+            (Decimal(str(amount)) * inv_multiplier)
+            .to_integral_value(rounding=ROUND_FLOOR)
+        )
+
+    def compute_sizes_batch(self, amounts, symbols):
+        """Vectorized sizing for backtesting: amounts -> contract sizes.
+
+        Looks up each symbol's multiplier once through the contract cache
+        and dispatches the arithmetic to the numba kernel in
+        ``sizing_numba``. Requires the optional numba and numpy
+        dependencies.
+
+        :param amounts: array-like of order amounts
+        :param symbols: list of contract symbols, one per amount
+        """
+        try:
+            from ..sizing_numba import compute_sizes, np
+        except ImportError as exc:
+            raise ImportError(
+                "compute_sizes_batch requires the optional "
+                "numba and numpy dependencies"
+            ) from exc
+
+        multipliers = np.empty(len(symbols), np.float64)
+        for i, symbol in enumerate(symbols):
+            multipliers[i] = self.contract_info(symbol)["multiplier"]
+
+        return compute_sizes(np.asarray(amounts, np.float64), multipliers)
+
+    @staticmethod
+    def _build_reduce_only(
+        order: dict,
+        side: str,
+        stop_price: float,
+        stop: str
+    ) -> dict:
+        """Build a reduce-only stop order mirroring ``order``.
+
+        Only the fields a stop-loss / take-profit order actually needs are
+        carried over instead of copying the whole main order.
+        """
+        reduce_order = {
+            'symbol': order['symbol'],
+            'leverage': order.get('leverage'),
+            'type': order['type'],
+            'price': order.get('price'),
+            'size': order.get('size'),
+            'clientOid': flat_uuid(),
+            'side': side,
+            'stop': stop,
+            'stopPrice': stop_price,
+            'stopPriceType': "TP",
+            'reduceOnly': True
+        }
+        return {k: v for k, v in reduce_order.items() if v is not None}
+
+    def _cached_contract(self, symbol: str) -> Optional[dict]:
+        entry = self._contract_cache.get(symbol)
+        if entry and time.monotonic() - entry[0] < self.CONTRACT_CACHE_TTL:
+            return entry[1]
+        return None
+
+    def _store_contract(self, symbol: str, data: dict) -> None:
+        self._contract_cache[symbol] = (time.monotonic(), data)
+
+        # the Decimal conversion happens once per symbol, on cache insertion
+        multiplier = data.get("multiplier")
+        if multiplier:
+            self._inv_multipliers[symbol] = \
+                Decimal(1) / Decimal(str(multiplier))
+
+    def clear_contract_cache(self) -> None:
+        """Drop all cached contract metadata."""
+        self._contract_cache.clear()
+        self._inv_multipliers.clear()
+
     def contract_info(self, symbol: str) -> dict:
-        return self._request("GET", f"contracts/{symbol}")
+        cached = self._cached_contract(symbol)
+        if cached is not None:
+            return cached
 
-    def create_limit_order(
-        self,
+        data = self._request("GET", f"contracts/{symbol}")
+        self._store_contract(symbol, data)
+        return data
+
+    @staticmethod
+    def _limit_order_payload(
         side: str,
         price: str,
         symbol: str,
         leverage: str,
-        amount: Optional[float] = None,
         size: Optional[int] = None,
         client_oid: Optional[bool] = None,
         remark: Optional[str] = None,
@@ -215,14 +340,11 @@ class Client:
         hidden: Optional[str] = None,
         iceberg: Optional[str] = None,
         visible_size: Optional[str] = "",
-        stop_loss_price: Optional[float] = None,
-        take_profit_price: Optional[float] = None,
     ) -> dict:
-        # Validate input
+        # hidden/iceberg checks live in validate_order; only the flags that
+        # never enter the payload are validated here
         validate_time_in_force(time_in_force)
         validate_post_only(post_only, time_in_force)
-        validate_hidden_and_iceberg(hidden, iceberg)
-        validate_iceberg(iceberg, visible_size)
 
         order = {
             'symbol': symbol.upper(),
@@ -232,30 +354,108 @@ class Client:
             'size': size
         }
 
-        if client_oid:
-            order['clientOid'] = client_oid
-        if leverage:
-            order['leverage'] = leverage
-        if remark:
-            order['remark'] = remark
-        if stop:
-            order['stop'] = stop
-        if stop_price:
-            order['stopPrice'] = stop_price
-        if stop_price_type:
-            order['stopPriceType'] = stop_price_type
-        if reduce_only:
-            order['reduceOnly'] = reduce_only
-        if close_order:
-            order['closeOrder'] = close_order
-        if force_hold:
-            order['forceHold'] = force_hold
-        if hidden:
-            order['hidden'] = hidden
+        candidates = (
+            ('clientOid', client_oid),
+            ('leverage', leverage),
+            ('remark', remark),
+            ('stop', stop),
+            ('stopPrice', stop_price),
+            ('stopPriceType', stop_price_type),
+            ('reduceOnly', reduce_only),
+            ('closeOrder', close_order),
+            ('forceHold', force_hold),
+            ('hidden', hidden),
+            ('iceberg', iceberg),
+        )
+        order.update((k, v) for k, v in candidates if v)
+
         if iceberg:
-            order['iceberg'] = iceberg
             order['visible_size'] = visible_size
 
+        return order
+
+    @staticmethod
+    def _market_order_payload(
+        side: str,
+        symbol: str,
+        leverage: str,
+        size: Optional[int] = None,
+        client_oid: Optional[bool] = None,
+        remark: Optional[str] = None,
+        stop: Optional[str] = None,
+        stop_price: Optional[str] = None,
+        stop_price_type: Optional[str] = None,
+        reduce_only: Optional[str] = None,
+        close_order: Optional[str] = None,
+        force_hold: Optional[bool] = None,
+    ) -> dict:
+        order = {
+            'symbol': symbol.upper(),
+            'side': side.lower(),
+            'type': "market",
+            'size': size
+        }
+
+        candidates = (
+            ('clientOid', client_oid),
+            ('leverage', leverage),
+            ('remark', remark),
+            ('stop', stop),
+            ('stopPrice', stop_price),
+            ('stopPriceType', stop_price_type),
+            ('reduceOnly', reduce_only),
+            ('closeOrder', close_order),
+            ('forceHold', force_hold),
+        )
+        order.update((k, v) for k, v in candidates if v)
+
+        return order
+
+    def create_limit_order(
+        self,
+        side: str,
+        price: str,
+        symbol: str,
+        leverage: str,
+        amount: Optional[float] = None,
+        size: Optional[int] = None,
+        client_oid: Optional[bool] = None,
+        remark: Optional[str] = None,
+        stop: Optional[str] = None,
+        stop_price: Optional[str] = None,
+        stop_price_type: Optional[str] = None,
+        reduce_only: Optional[str] = None,
+        close_order: Optional[str] = None,
+        force_hold: Optional[bool] = None,
+        time_in_force: Optional[str] = None,
+        post_only: Optional[str] = None,
+        hidden: Optional[str] = None,
+        iceberg: Optional[str] = None,
+        visible_size: Optional[str] = "",
+        stop_loss_price: Optional[float] = None,
+        take_profit_price: Optional[float] = None,
+    ) -> dict:
+        order = self._limit_order_payload(
+            side=side,
+            price=price,
+            symbol=symbol,
+            leverage=leverage,
+            size=size,
+            client_oid=client_oid,
+            remark=remark,
+            stop=stop,
+            stop_price=stop_price,
+            stop_price_type=stop_price_type,
+            reduce_only=reduce_only,
+            close_order=close_order,
+            force_hold=force_hold,
+            time_in_force=time_in_force,
+            post_only=post_only,
+            hidden=hidden,
+            iceberg=iceberg,
+            visible_size=visible_size,
+        )
+
         return self._create_order(
             order,
             amount,
@@ -281,32 +481,20 @@ class Client:
         stop_loss_price: Optional[float] = None,
         take_profit_price: Optional[float] = None,
     ) -> dict:
-
-        order = {
-            'symbol': symbol.upper(),
-            'side': side.lower(),
-            'type': "market",
-            'size': size
-        }
-
-        if client_oid:
-            order['clientOid'] = client_oid
-        if leverage:
-            order['leverage'] = leverage
-        if remark:
-            order['remark'] = remark
-        if stop:
-            order['stop'] = stop
-        if stop_price:
-            order['stopPrice'] = stop_price
-        if stop_price_type:
-            order['stopPriceType'] = stop_price_type
-        if reduce_only:
-            order['reduceOnly'] = reduce_only
-        if close_order:
-            order['closeOrder'] = close_order
-        if force_hold:
-            order['forceHold'] = force_hold
+        order = self._market_order_payload(
+            side=side,
+            symbol=symbol,
+            leverage=leverage,
+            size=size,
+            client_oid=client_oid,
+            remark=remark,
+            stop=stop,
+            stop_price=stop_price,
+            stop_price_type=stop_price_type,
+            reduce_only=reduce_only,
+            close_order=close_order,
+            force_hold=force_hold,
+        )
 
         return self._create_order(
             order,
@@ -0,0 +1,232 @@
+import asyncio
+from typing import Optional
+
+import httpx
+
+from ....common.utils import flat_uuid
+from ..validations import validate_order
+from .perp import Client, _json_dumps
+
+
+class AsyncClient(Client):
+    """Asyncio variant of :class:`Client` built on httpx with HTTP/2.
+
+    Signing, validation and payload building are shared with the blocking
+    client; only the transport differs. Dependent stop-loss and take-profit
+    orders are submitted concurrently, multiplexed over a single connection.
+
+    Requires the optional httpx dependency with its HTTP/2 extra
+    (``pip install httpx[http2]``); constructing the client fails without
+    the ``h2`` package.
+    """
+
+    def __init__(self, api_key, api_secret, passphrase):
+        super().__init__(api_key, api_secret, passphrase)
+        self._aclient = httpx.AsyncClient(
+            http2=True,
+            base_url=self.API_URL,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            ),
+            timeout=float(self._timeout)
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying httpx client and its pooled connections."""
+        await self._aclient.aclose()
+        self.close()
+
+    async def _arequest(
+            self,
+            method: str,
+            path: str,
+            api_version: Optional[str] = None,
+            **kwargs
+    ) -> dict:
+        # serialize once; the same bytes are signed and sent as the body
+        data = _json_dumps(kwargs.get('data', {}))
+
+        full_path = self._create_path(path, api_version)
+
+        headers = self._signed_headers(method, full_path, data)
+
+        response = await self._aclient.request(
+            method=method,
+            url=full_path,
+            content=data,
+            headers=headers
+        )
+        return self._handle_response(response)
+
+    async def _create_order(
+        self,
+        order: dict,
+        amount: float,
+        stop_loss_price: float,
+        take_profit_price: float
+    ) -> dict:
+        validate_order(order, amount, stop_loss_price, take_profit_price)
+
+        if order.get("clientOid") is None:
+            order["clientOid"] = flat_uuid()
+
+        if amount:
+            symbol = order['symbol']
+            # populates the per-symbol inverse multiplier as a side effect
+            await self.contract_info(symbol)
+            order["size"] = self._amount_to_size(
+                amount, self._inv_multipliers[symbol])
+
+        new_order_response = await self._arequest("POST", "orders", data=order)
+
+        followups = []
+
+        side = order['side']
+        opposite = "sell" if side == "buy" else "buy"
+        direction_down = "down" if side == "buy" else "up"
+        direction_up = "up" if side == "buy" else "down"
+
+        if stop_loss_price:
+            stop_loss_order = self._build_reduce_only(
+                order, opposite, stop_loss_price, direction_down)
+            followups.append(
+                self._arequest("POST", "orders", data=stop_loss_order))
+
+        if take_profit_price:
+            take_profit_order = self._build_reduce_only(
+                order, opposite, take_profit_price, direction_up)
+            followups.append(
+                self._arequest("POST", "orders", data=take_profit_order))
+
+        if followups:
+            await asyncio.gather(*followups)
+
+        return new_order_response
+
+    async def compute_sizes_batch(self, amounts, symbols):
+        """Async variant of :meth:`Client.compute_sizes_batch`.
+
+        Awaits the coroutine contract_info override when resolving
+        multipliers; the kernel dispatch itself is unchanged. Requires
+        the optional numba and numpy dependencies.
+
+        :param amounts: array-like of order amounts
+        :param symbols: list of contract symbols, one per amount
+        """
+        try:
+            from ..sizing_numba import compute_sizes, np
+        except ImportError as exc:
+            raise ImportError(
+                "compute_sizes_batch requires the optional "
+                "numba and numpy dependencies"
+            ) from exc
+
+        multipliers = np.empty(len(symbols), np.float64)
+        for i, symbol in enumerate(symbols):
+            symbol_info = await self.contract_info(symbol)
+            multipliers[i] = symbol_info["multiplier"]
+
+        return compute_sizes(np.asarray(amounts, np.float64), multipliers)
+
+    async def contract_info(self, symbol: str) -> dict:
+        cached = self._cached_contract(symbol)
+        if cached is not None:
+            return cached
+
+        data = await self._arequest("GET", f"contracts/{symbol}")
+        self._store_contract(symbol, data)
+        return data
+
+    async def create_limit_order(
+        self,
+        side: str,
+        price: str,
+        symbol: str,
+        leverage: str,
+        amount: Optional[float] = None,
+        size: Optional[int] = None,
+        client_oid: Optional[bool] = None,
+        remark: Optional[str] = None,
+        stop: Optional[str] = None,
+        stop_price: Optional[str] = None,
+        stop_price_type: Optional[str] = None,
+        reduce_only: Optional[str] = None,
+        close_order: Optional[str] = None,
+        force_hold: Optional[bool] = None,
+        time_in_force: Optional[str] = None,
+        post_only: Optional[str] = None,
+        hidden: Optional[str] = None,
+        iceberg: Optional[str] = None,
+        visible_size: Optional[str] = "",
+        stop_loss_price: Optional[float] = None,
+        take_profit_price: Optional[float] = None,
+    ) -> dict:
+        order = self._limit_order_payload(
+            side=side,
+            price=price,
+            symbol=symbol,
+            leverage=leverage,
+            size=size,
+            client_oid=client_oid,
+            remark=remark,
+            stop=stop,
+            stop_price=stop_price,
+            stop_price_type=stop_price_type,
+            reduce_only=reduce_only,
+            close_order=close_order,
+            force_hold=force_hold,
+            time_in_force=time_in_force,
+            post_only=post_only,
+            hidden=hidden,
+            iceberg=iceberg,
+            visible_size=visible_size,
+        )
+
+        return await self._create_order(
+            order,
+            amount,
+            stop_loss_price,
+            take_profit_price
+        )
+
+    async def create_market_order(
+        self,
+        side: str,
+        symbol: str,
+        leverage: str,
+        amount: Optional[float] = None,
+        size: Optional[int] = None,
+        client_oid: Optional[bool] = None,
+        remark: Optional[str] = None,
+        stop: Optional[str] = None,
+        stop_price: Optional[str] = None,
+        stop_price_type: Optional[str] = None,
+        reduce_only: Optional[str] = None,
+        close_order: Optional[str] = None,
+        force_hold: Optional[bool] = None,
+        stop_loss_price: Optional[float] = None,
+        take_profit_price: Optional[float] = None,
+    ) -> dict:
+        order = self._market_order_payload(
+            side=side,
+            symbol=symbol,
+            leverage=leverage,
+            size=size,
+            client_oid=client_oid,
+            remark=remark,
+            stop=stop,
+            stop_price=stop_price,
+            stop_price_type=stop_price_type,
+            reduce_only=reduce_only,
+            close_order=close_order,
+            force_hold=force_hold,
+        )
+
+        return await self._create_order(
+            order,
+            amount,
+            stop_loss_price,
+            take_profit_price
+        )
@@ -0,0 +1,22 @@
+"""Optional numba-compiled sizing kernel for offline / backtesting use.
+
+Importing this module requires the optional ``numba`` and ``numpy``
+dependencies; the live order path never imports it.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def compute_sizes(amounts, multipliers):
+    """Convert arrays of amounts and contract multipliers into sizes.
+
+    Float approximation of :meth:`Client._amount_to_size` (which uses
+    Decimal on the live path), intended for streaming thousands of
+    hypothetical orders through the sizing logic at once.
+    """
+    out = np.empty(amounts.shape[0], np.int64)
+    for i in range(amounts.shape[0]):
+        out[i] = np.int64(amounts[i] / multipliers[i])
+    return out
@@ -1,20 +1,78 @@
 from typing import Optional
 
-import requests
-
 from .exceptions import OrderParameterValidationException
 
-VALID_SIDE = ("buy", "sell")
-VALID_STOP = ("down", "up")
-VALID_STOP_PRICE_TYPE = ("TP", "MP", "IP")
-VALID_TIME_IN_FORCE = ("GTC", "IOC")
+VALID_SIDE = frozenset(("buy", "sell"))
+VALID_STOP = frozenset(("down", "up"))
+VALID_STOP_PRICE_TYPE = frozenset(("TP", "MP", "IP"))
+VALID_TIME_IN_FORCE = frozenset(("GTC", "IOC"))
+
+# error messages are built once at import time so the success path of each
+# validator is a single hash lookup with no string work
+_SIDE_ERR = f"Order 'side' need to be one of {sorted(VALID_SIDE)}"
+_STOP_ERR = f"Property 'stop' need to be one of {sorted(VALID_STOP)}"
+_STOP_PRICE_TYPE_ERR = (
+    "Property 'stop_price_type' need to be "
+    f"one of {sorted(VALID_STOP_PRICE_TYPE)}"
+)
+_STOP_PRICE_ERR = "Property 'stop_price' need to be defined"
+_STOP_LOSS_TAKE_PROFIT_ERR = (
+    "If property 'stop_loss' or 'take_profit' defined "
+    "property 'stop' need to be empty"
+)
+_TIME_IN_FORCE_ERR = (
+    "Property 'time_in_force' need to be "
+    f"one of: {sorted(VALID_TIME_IN_FORCE)}"
+)
+_POST_ONLY_ERR = (
+    "If property 'post_only' defined, 'time_in_force' need to be GTC"
+)
+_HIDDEN_ICEBERG_ERR = "Only one of 'hidden' and 'iceberg' can be defined"
+_ICEBERG_ERR = (
+    "If property 'iceberg' is defined, "
+    "property 'visible_size' need to be defined"
+)
+_AMOUNT_SIZE_ERR = "Either 'amount' or 'size' need to be empty."
+
+
+def validate_order(
+    order: dict,
+    amount: Optional[float],
+    stop_loss: Optional[float],
+    take_profit: Optional[float]
+) -> None:
+    """Run every check on a built order payload in one straight-line pass.
+
+    Fuses the individual ``validate_*`` helpers so order creation costs a
+    single validator call frame instead of one per check.
+    """
+    if order["side"] not in VALID_SIDE:
+        raise OrderParameterValidationException(_SIDE_ERR)
+
+    stop = order.get("stop")
+    if stop:
+        if stop not in VALID_STOP:
+            raise OrderParameterValidationException(_STOP_ERR)
+        if order.get("stopPriceType") not in VALID_STOP_PRICE_TYPE:
+            raise OrderParameterValidationException(_STOP_PRICE_TYPE_ERR)
+        if not order.get("stopPrice"):
+            raise OrderParameterValidationException(_STOP_PRICE_ERR)
+        if stop_loss or take_profit:
+            raise OrderParameterValidationException(_STOP_LOSS_TAKE_PROFIT_ERR)
+
+    if amount and order.get("size"):
+        raise OrderParameterValidationException(_AMOUNT_SIZE_ERR)
+
+    iceberg = order.get("iceberg")
+    if order.get("hidden") and iceberg:
+        raise OrderParameterValidationException(_HIDDEN_ICEBERG_ERR)
+    if iceberg and not order.get("visible_size"):
+        raise OrderParameterValidationException(_ICEBERG_ERR)
 
 
 def validate_side(side: str) -> None:
     if side not in VALID_SIDE:
-        raise OrderParameterValidationException(
-            f"Order 'side' need to be one of {VALID_SIDE}"
-        )
+        raise OrderParameterValidationException(_SIDE_ERR)
 
 
 def validate_stop(
@@ -26,18 +84,11 @@ def validate_stop(
         return
 
     if stop not in VALID_STOP:
-        raise OrderParameterValidationException(
-            f"Property 'stop' need to be one of {VALID_STOP}"
-        )
+        raise OrderParameterValidationException(_STOP_ERR)
     if stop_price_type not in VALID_STOP_PRICE_TYPE:
-        raise OrderParameterValidationException(
-            "Property 'stop_price_type' need to be "
-            f"one of {VALID_STOP_PRICE_TYPE}"
-        )
+        raise OrderParameterValidationException(_STOP_PRICE_TYPE_ERR)
     if not stop_price:
-        raise OrderParameterValidationException(
-            f"Property 'stop_price' need to be defined"
-        )
+        raise OrderParameterValidationException(_STOP_PRICE_ERR)
 
 
 def validate_stop_loss_take_profit(
@@ -46,10 +97,7 @@ def validate_stop_loss_take_profit(
     take_profit: Optional[str]
 ) -> None:
     if stop and (stop_loss or take_profit):
-        raise OrderParameterValidationException(
-            f"If property 'stop_loss' or 'take_profit' defined "
-            "proerty 'stop' need to be empty"
-        )
+        raise OrderParameterValidationException(_STOP_LOSS_TAKE_PROFIT_ERR)
 
 
 def validate_time_in_force(time_in_force: Optional[str]) -> None:
@@ -57,21 +105,15 @@ def validate_time_in_force(time_in_force: Optional[str]) -> None:
         return
 
     if time_in_force not in VALID_TIME_IN_FORCE:
-        raise OrderParameterValidationException(
-            "Property 'time_in_force' need to be "
-            f"one of: {VALID_TIME_IN_FORCE}"
-        )
+        raise OrderParameterValidationException(_TIME_IN_FORCE_ERR)
 
 
 def validate_post_only(
-        time_in_force: Optional[str],
-        post_only: Optional[bool]
+        post_only: Optional[bool],
+        time_in_force: Optional[str]
 ) -> None:
-    if post_only and time_in_force != VALID_TIME_IN_FORCE[0]:
-        raise OrderParameterValidationException(
-            "If property 'post_only' defined, "
-            f"'time_in_force' need to be {VALID_TIME_IN_FORCE[0]}"
-        )
+    if post_only and time_in_force != "GTC":
+        raise OrderParameterValidationException(_POST_ONLY_ERR)
 
 
 def validate_hidden_and_iceberg(
@@ -79,9 +121,7 @@ def validate_hidden_and_iceberg(
     iceberg: Optional[bool]
 ) -> None:
     if hidden and iceberg:
-        raise OrderParameterValidationException(
-            f"Only one of 'hodden' and 'iceberg' can be defined"
-        )
+        raise OrderParameterValidationException(_HIDDEN_ICEBERG_ERR)
 
 
 def validate_iceberg(
@@ -89,9 +129,7 @@ def validate_iceberg(
     visible_size: Optional[int]
 ) -> None:
     if iceberg and not visible_size:
-        raise OrderParameterValidationException(
-            f"If property 'iceberg' is defined, proerty 'visible_size' need to be empty"
-        )
+        raise OrderParameterValidationException(_ICEBERG_ERR)
 
 
 def validate_amount_size(
@@ -99,6 +137,4 @@ def validate_amount_size(
     size: Optional[int]
 ) -> None:
     if amount and size:
-        raise OrderParameterValidationException(
-            f"Either 'amount' or 'size' need to be empty."
-        )
+        raise OrderParameterValidationException(_AMOUNT_SIZE_ERR)